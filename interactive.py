@@ -1,14 +1,36 @@
+import bisect
 import os
+import sys
 import time
 import collections
+import heapq
+import math
 import random
 
-# --- Helper function to clear the terminal screen ---
-def clear_screen():
-    os.system('cls' if os.name == 'nt' else 'clear')
+# Progress bars for every possible fill level, so rows never rebuild them
+BAR_LEN = 15
+PROGRESS_BARS = ['█' * k + '-' * (BAR_LEN - k) for k in range(BAR_LEN + 1)]
+
+# --- Helper functions for the terminal screen ---
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+
+def enable_ansi():
+    # Windows consoles only interpret ANSI escapes once VT processing is switched on
+    if os.name != 'nt':
+        return
+    import ctypes
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+    mode = ctypes.c_ulong()
+    if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+        kernel32.SetConsoleMode(handle, mode.value | 0x0004)  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
 
 # --- Process class is updated with a 'deadline' attribute ---
 class Process:
+    __slots__ = ('pid', 'arrival_time', 'burst_time', 'tickets', 'deadline',
+                 'start_time', 'completion_time', 'turnaround_time', 'waiting_time',
+                 'remaining_burst_time', '_repr')
+
     def __init__(self, pid, arrival_time, burst_time, tickets=10, deadline=0): # deadline added
         self.pid = pid
         self.arrival_time = arrival_time
@@ -22,199 +44,348 @@ class Process:
         self.turnaround_time = 0
         self.waiting_time = 0
         self.remaining_burst_time = burst_time
+        # Cached display label, since the visualizer prints it on every frame
+        self._repr = f"P{pid}"
 
     def __repr__(self):
-        return f"P{self.pid}"
+        return self._repr
 
 # --- SCHEDULER GENERATORS ---
 # FCFS, SRTF, Round Robin, and Lottery schedulers remain the same.
 # For brevity, they are omitted here but are required in the final script.
 # You can copy them from the previous response.
 
+def group_arrivals(processes):
+    """Groups processes by arrival time; returns (arrivals, sorted distinct arrival times)"""
+    arrivals = collections.defaultdict(list)
+    for p in processes:
+        arrivals[p.arrival_time].append(p)
+    return arrivals, collections.deque(sorted(arrivals))
+
 def fcfs_scheduler(processes):
-    processes.sort(key=lambda p: p.arrival_time)
+    n = len(processes)
     current_time = 0
-    ready_queue = []
+    ready_queue = collections.deque()
     completed = []
     running_process = None
-    process_queue = collections.deque(processes)
-    while len(completed) < len(processes):
-        while process_queue and process_queue[0].arrival_time <= current_time:
-            ready_queue.append(process_queue.popleft())
+    arrivals, arrival_times = group_arrivals(processes)
+    while len(completed) < n:
+        while arrival_times and arrival_times[0] <= current_time:
+            ready_queue.extend(arrivals.pop(arrival_times.popleft()))
         if not running_process and ready_queue:
-            running_process = ready_queue.pop(0)
+            running_process = ready_queue.popleft()
         yield current_time, running_process, ready_queue, completed
+        # Jump straight to the next event: an arrival or the running process finishing
+        next_arrival = arrival_times[0] if arrival_times else math.inf
+        delta = next_arrival - current_time
         if running_process:
-            running_process.remaining_burst_time -= 1
+            delta = min(delta, running_process.remaining_burst_time)
+            running_process.remaining_burst_time -= delta
             if running_process.remaining_burst_time == 0:
                 completed.append(running_process)
                 running_process = None
-        current_time += 1
+        current_time += delta
     yield current_time, None, [], completed
 
 def srtf_scheduler(processes):
+    n = len(processes)
     current_time = 0
+    # Min-heap of (remaining_burst_time, pid, process); the running process is kept
+    # out of the heap so the stored keys never go stale.
     ready_queue = []
     completed = []
     running_process = None
-    remaining_procs = sorted(processes, key=lambda p: p.arrival_time)
-    while len(completed) < len(processes):
-        while remaining_procs and remaining_procs[0].arrival_time <= current_time:
-            ready_queue.append(remaining_procs.pop(0))
+    arrivals, arrival_times = group_arrivals(processes)
+    while len(completed) < n:
+        while arrival_times and arrival_times[0] <= current_time:
+            for p in arrivals.pop(arrival_times.popleft()):
+                heapq.heappush(ready_queue, (p.remaining_burst_time, p.pid, p))
         if ready_queue:
-            ready_queue.sort(key=lambda p: p.remaining_burst_time)
-            shortest_process = ready_queue[0]
+            shortest_process = ready_queue[0][2]
             if running_process and shortest_process.remaining_burst_time < running_process.remaining_burst_time:
-                ready_queue.append(running_process)
-                running_process = ready_queue.pop(0)
+                running_process = heapq.heapreplace(ready_queue, (running_process.remaining_burst_time, running_process.pid, running_process))[2]
             elif not running_process:
-                running_process = ready_queue.pop(0)
+                running_process = heapq.heappop(ready_queue)[2]
         yield current_time, running_process, ready_queue, completed
+        # Jump straight to the next event: an arrival or the running process finishing
+        next_arrival = arrival_times[0] if arrival_times else math.inf
+        delta = next_arrival - current_time
         if running_process:
-            running_process.remaining_burst_time -= 1
+            delta = min(delta, running_process.remaining_burst_time)
+            running_process.remaining_burst_time -= delta
             if running_process.remaining_burst_time == 0:
                 completed.append(running_process)
                 running_process = None
-        current_time += 1
+        current_time += delta
     yield current_time, None, [], completed
 
 def round_robin_scheduler(processes, time_quantum):
+    # Each step advances by at most the quantum, so it must be positive for time to move.
+    # Checked here, not in the generator, whose body only runs on the first next().
+    if time_quantum < 1:
+        raise ValueError("time_quantum must be at least 1")
+    return _round_robin_steps(processes, time_quantum)
+
+def _round_robin_steps(processes, time_quantum):
+    n = len(processes)
     current_time = 0
     ready_queue = collections.deque()
     completed = []
     running_process = None
     quantum_slice = 0
-    procs_to_arrive = sorted(processes, key=lambda p: p.arrival_time)
-    while len(completed) < len(processes):
-        while procs_to_arrive and procs_to_arrive[0].arrival_time <= current_time:
-            ready_queue.append(procs_to_arrive.pop(0))
+    arrivals, arrival_times = group_arrivals(processes)
+    while len(completed) < n:
+        while arrival_times and arrival_times[0] <= current_time:
+            ready_queue.extend(arrivals.pop(arrival_times.popleft()))
         if not running_process and ready_queue:
             running_process = ready_queue.popleft()
             quantum_slice = 0
         yield current_time, running_process, list(ready_queue), completed
+        # Jump straight to the next event: an arrival, the running
+        # process finishing, or its quantum expiring
+        next_arrival = arrival_times[0] if arrival_times else math.inf
+        delta = next_arrival - current_time
         if running_process:
-            running_process.remaining_burst_time -= 1
-            quantum_slice += 1
+            delta = min(delta, running_process.remaining_burst_time, time_quantum - quantum_slice)
+            running_process.remaining_burst_time -= delta
+            quantum_slice += delta
             if running_process.remaining_burst_time == 0:
                 completed.append(running_process)
                 running_process = None
             elif quantum_slice == time_quantum:
                 ready_queue.append(running_process)
                 running_process = None
-        current_time += 1
+        current_time += delta
     yield current_time, None, [], completed
 
 def lottery_scheduler(processes):
+    n = len(processes)
     current_time = 0
     ready_queue = []
+    # cum_tickets[i] is the number of tickets held by ready_queue[:i + 1]
+    cum_tickets = []
+    total_tickets = 0
     completed = []
     running_process = None
-    procs_to_arrive = sorted(processes, key=lambda p: p.arrival_time)
-    while len(completed) < len(processes):
-        while procs_to_arrive and procs_to_arrive[0].arrival_time <= current_time:
-            ready_queue.append(procs_to_arrive.pop(0))
-        if not running_process and ready_queue:
-            total_tickets = sum(p.tickets for p in ready_queue)
-            if total_tickets > 0:
-                winning_ticket = random.randint(1, total_tickets)
-                ticket_sum = 0
-                for process in ready_queue:
-                    ticket_sum += process.tickets
-                    if ticket_sum >= winning_ticket:
-                        running_process = process
-                        break
-                ready_queue.remove(running_process)
+    arrivals, arrival_times = group_arrivals(processes)
+    while len(completed) < n:
+        while arrival_times and arrival_times[0] <= current_time:
+            for p in arrivals.pop(arrival_times.popleft()):
+                ready_queue.append(p)
+                total_tickets += p.tickets
+                cum_tickets.append(total_tickets)
+        if not running_process and ready_queue and total_tickets > 0:
+            winning_ticket = random.randint(1, total_tickets)
+            winner = bisect.bisect_left(cum_tickets, winning_ticket)
+            running_process = ready_queue.pop(winner)
+            cum_tickets.pop(winner)
+            total_tickets -= running_process.tickets
+            for i in range(winner, len(cum_tickets)):
+                cum_tickets[i] -= running_process.tickets
         yield current_time, running_process, ready_queue, completed
+        # Jump straight to the next event: an arrival or the running process finishing
+        next_arrival = arrival_times[0] if arrival_times else math.inf
+        delta = next_arrival - current_time
         if running_process:
-            running_process.remaining_burst_time -= 1
+            delta = min(delta, running_process.remaining_burst_time)
+            running_process.remaining_burst_time -= delta
             if running_process.remaining_burst_time == 0:
                 completed.append(running_process)
                 running_process = None
-        current_time += 1
+        current_time += delta
     yield current_time, None, [], completed
 
 def edf_scheduler(processes):
     """Earliest Deadline First (EDF) Scheduling Generator"""
+    n = len(processes)
     current_time = 0
+    # Min-heap of (deadline, pid, process); deadlines never change, so keys stay valid
     ready_queue = []
     completed = []
     running_process = None
-    procs_to_arrive = sorted(processes, key=lambda p: p.arrival_time)
+    arrivals, arrival_times = group_arrivals(processes)
     
-    while len(completed) < len(processes):
+    while len(completed) < n:
         # Add newly arrived processes to the ready queue
-        while procs_to_arrive and procs_to_arrive[0].arrival_time <= current_time:
-            ready_queue.append(procs_to_arrive.pop(0))
+        while arrival_times and arrival_times[0] <= current_time:
+            for p in arrivals.pop(arrival_times.popleft()):
+                heapq.heappush(ready_queue, (p.deadline, p.pid, p))
 
         if ready_queue:
-            # Sort the ready queue by the earliest deadline
-            ready_queue.sort(key=lambda p: p.deadline)
-            earliest_deadline_proc = ready_queue[0]
+            # The heap root is the process with the earliest deadline
+            earliest_deadline_proc = ready_queue[0][2]
             
             # Preemption Check: if a new process has an earlier deadline
             if running_process and earliest_deadline_proc.deadline < running_process.deadline:
-                ready_queue.append(running_process)
-                running_process = ready_queue.pop(0)
+                # The root is strictly earlier than the preempted process, so swap them in one sift
+                running_process = heapq.heapreplace(ready_queue, (running_process.deadline, running_process.pid, running_process))[2]
             elif not running_process:
-                running_process = ready_queue.pop(0)
+                running_process = heapq.heappop(ready_queue)[2]
         
         yield current_time, running_process, ready_queue, completed
 
+        # Jump straight to the next event: an arrival or the running process finishing
+        next_arrival = arrival_times[0] if arrival_times else math.inf
+        delta = next_arrival - current_time
         if running_process:
-            running_process.remaining_burst_time -= 1
+            delta = min(delta, running_process.remaining_burst_time)
+            running_process.remaining_burst_time -= delta
             if running_process.remaining_burst_time == 0:
                 completed.append(running_process)
                 running_process = None
         
-        current_time += 1
+        current_time += delta
     yield current_time, None, [], completed
 
+# --- Headless Simulation (for batch runs) ---
+def simulate(processes_data, scheduler_func):
+    """Runs a scheduler without the visualizer and returns (processes, event_log)"""
+    processes = [Process(**p) for p in processes_data]
+    # Compact event log of (time, pid) CPU switches; pid is None while idle
+    event_log = []
+    done = 0
+    for current_time, running, ready, completed in scheduler_func(processes):
+        # Anything completed since the previous event finished exactly now
+        for p in completed[done:]:
+            p.completion_time = current_time
+            p.turnaround_time = p.completion_time - p.arrival_time
+            p.waiting_time = p.turnaround_time - p.burst_time
+        done = len(completed)
+        if running and running.start_time == -1:
+            running.start_time = current_time
+        pid = running.pid if running else None
+        if not event_log or event_log[-1][1] != pid:
+            event_log.append((current_time, pid))
+    return processes, event_log
+
+def compute_metrics(processes_data, scheduler_func):
+    """Average turnaround and waiting time of a scheduler over a workload"""
+    processes, _ = simulate(processes_data, scheduler_func)
+    n = len(processes)
+    if not n:
+        return {'avg_turnaround_time': 0.0, 'avg_waiting_time': 0.0}
+    return {
+        'avg_turnaround_time': sum(p.turnaround_time for p in processes) / n,
+        'avg_waiting_time': sum(p.waiting_time for p in processes) / n,
+    }
+
 # --- Main Visual Simulator (updated draw_state) ---
 class VisualSimulator:
     def __init__(self, processes, scheduler_func):
         self.processes = [Process(**p) for p in processes]
         self.scheduler = scheduler_func(self.processes)
         self.history = []
+        self._history_running = None
+
+        # The process table only changes in the "Rem" and "Progress" columns, so
+        # format the static columns once and rebuild a row only when it changes.
+        self._proc_order = sorted(self.processes, key=lambda p: p.pid)
+        self._static_prefix = [f"{p.pid:<3} | {p.arrival_time:<7} | {p.burst_time:<5} | " for p in self._proc_order]
+        self._static_suffix = [f" | {p.deadline:<8} | {p.tickets:<7} | " for p in self._proc_order]
+        self._pid_to_row = {p.pid: i for i, p in enumerate(self._proc_order)}
+        self._row_cache = [self._format_row(p, i) for i, p in enumerate(self._proc_order)]
+        # Between two frames only the process that was running can have progressed
+        self._prev_running = None
+        self._completed_pids = []
+        self._cpu_state_owner = object()  # sentinel: no CPU line formatted yet
+        self._cpu_state = ""
+
+    def _format_row(self, p, i):
+        progress = (p.burst_time - p.remaining_burst_time) / p.burst_time
+        progress_bar = PROGRESS_BARS[int(BAR_LEN * progress)]
+        return (f"{self._static_prefix[i]}{p.remaining_burst_time:<3}{self._static_suffix[i]}"
+                f"[{progress_bar}] {int(progress*100):>3}%\n")
 
     def draw_state(self, current_time, running, ready, completed):
-        clear_screen()
-        print("--- CPU Scheduling Visualizer ---")
-        print(f"Current Time: {current_time}")
-        cpu_state = f"[  {running}  ]" if running else "[ IDLE ]"
-        print(f"CPU: {cpu_state}")
+        # The CPU line only changes when a different process (or none) is running
+        if running is not self._cpu_state_owner:
+            self._cpu_state = f"[  {running}  ]" if running else "[ IDLE ]"
+            self._cpu_state_owner = running
+        cpu_state = self._cpu_state
+        # SRTF/EDF hand over their raw (key, pid, process) heap; only order it when drawn
+        if ready and isinstance(ready[0], tuple):
+            ready = [entry[2] for entry in sorted(ready)]
         ready_state = ', '.join(map(str, ready)) if ready else "Empty"
-        print(f"Ready Queue: [ {ready_state} ]")
+        # Build the whole frame (including the screen clear) and emit it in one write,
+        # so the terminal never shows a blank screen between clear and repaint.
+        parts = [
+            CLEAR_SCREEN,
+            "--- CPU Scheduling Visualizer ---\n",
+            f"Current Time: {current_time}\n",
+            f"CPU: {cpu_state}\n",
+            f"Ready Queue: [ {ready_state} ]\n",
+            "\n--- Processes ---\n",
+            "PID | Arrival | Burst | Rem | Deadline | Tickets | Progress\n",
+            "----|---------|-------|-----|----------|---------|--------------------\n",
+        ]
         
-        print("\n--- Processes ---")
-        print("PID | Arrival | Burst | Rem | Deadline | Tickets | Progress")
-        print("----|---------|-------|-----|----------|---------|--------------------")
-        
-        all_procs = sorted(self.processes, key=lambda p: p.pid)
-        for p in all_procs:
-            progress = (p.burst_time - p.remaining_burst_time) / p.burst_time
-            bar_len = 15
-            filled_len = int(bar_len * progress)
-            progress_bar = '█' * filled_len + '-' * (bar_len - filled_len)
-            print(f"{p.pid:<3} | {p.arrival_time:<7} | {p.burst_time:<5} | {p.remaining_burst_time:<3} | {p.deadline:<8} | {p.tickets:<7} | [{progress_bar}] {int(progress*100):>3}%")
+        if self._prev_running is not None:
+            i = self._pid_to_row[self._prev_running.pid]
+            self._row_cache[i] = self._format_row(self._prev_running, i)
+        self._prev_running = running
+        parts.extend(self._row_cache)
             
-        print("\n--- Completed ---")
-        completed_pids = sorted([p.pid for p in completed])
-        print(', '.join(map(str, completed_pids)) if completed else "None")
-        print("-" * 55)
+        parts.append("\n--- Completed ---\n")
+        # Completed lists only grow, so insert just the new arrivals in pid order
+        for p in completed[len(self._completed_pids):]:
+            bisect.insort(self._completed_pids, p.pid)
+        parts.append(', '.join(map(str, self._completed_pids)) + "\n" if completed else "None\n")
+        parts.append("-" * 55 + "\n")
+        sys.stdout.write(''.join(parts))
+        sys.stdout.flush()
+
+    def record_history(self, current_time, running):
+        # Run-length encoded Gantt history: one (pid, start, duration) per CPU switch,
+        # with pid None while idle. The open segment is closed on the next switch.
+        if self.history and running is self._history_running:
+            return
+        if self.history:
+            self.close_history(current_time)
+        self.history.append((running.pid if running else None, current_time, 0))
+        self._history_running = running
 
-        if not self.history or self.history[-1] != cpu_state:
-            self.history.append(cpu_state)
+    def close_history(self, current_time):
+        pid, start, _ = self.history[-1]
+        self.history[-1] = (pid, start, current_time - start)
+
+    def draw_time(self, current_time):
+        # Rewrite only the "Current Time" line (row 2), then restore the cursor
+        sys.stdout.write(f"\x1b7\x1b[2;1HCurrent Time: {current_time}\x1b[K\x1b8")
+        sys.stdout.flush()
 
     def run(self, speed=0.5):
+        enable_ansi()
+        start = time.monotonic()
+        last_time = None
+        shown_time = 0  # latest time on screen, to close the Gantt history if interrupted
         try:
             for current_time, running, ready, completed in self.scheduler:
+                # Schedulers only yield on events, so in between just tick the clock line
+                # once per time unit. Everything is paced against the wall clock: time
+                # spent drawing doesn't add up as drift, and late ticks are skipped.
+                if last_time is not None and speed > 0:
+                    for tick in range(last_time + 1, current_time):
+                        slack = start + tick * speed - time.monotonic()
+                        if slack > 0:
+                            time.sleep(slack)
+                            self.draw_time(tick)
+                            shown_time = tick
+                slack = start + current_time * speed - time.monotonic()
+                if slack > 0:
+                    time.sleep(slack)
+                self.record_history(current_time, running)
                 self.draw_state(current_time, running, ready, completed)
-                time.sleep(speed)
+                last_time = shown_time = current_time
         except KeyboardInterrupt:
             print("\nSimulation stopped by user.")
         finally:
+            if self.history:
+                self.close_history(shown_time)
             print("\nSimulation Finished!")
-            print("Gantt Chart (visual): " + " ".join(self.history))
+            # Only an empty idle segment is dropped (the one opened when the run ends)
+            print("Gantt Chart (visual): " + " ".join(
+                f"P{pid}:{duration}" if pid is not None else f"IDLE:{duration}"
+                for pid, _, duration in self.history if duration or pid is not None))
 
 
 if __name__ == "__main__":
@@ -256,5 +427,9 @@ if __name__ == "__main__":
 
     if scheduler_to_run:
         simulation_speed = 0.5
-        simulator = VisualSimulator(processes_data, scheduler_to_run)
-        simulator.run(speed=simulation_speed)
\ No newline at end of file
+        try:
+            simulator = VisualSimulator(processes_data, scheduler_to_run)
+        except ValueError as e:
+            print(f"Invalid input: {e}. Exiting.")
+        else:
+            simulator.run(speed=simulation_speed)
\ No newline at end of file
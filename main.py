@@ -1,7 +1,12 @@
 import collections
+import heapq
+import sys
 
 # A simple class to represent a process
 class Process:
+    __slots__ = ('pid', 'arrival_time', 'burst_time', 'completion_time', 'turnaround_time',
+                 'waiting_time', 'start_time', 'remaining_burst_time')
+
     def __init__(self, pid, arrival_time, burst_time):
         self.pid = pid
         self.arrival_time = arrival_time
@@ -28,18 +33,22 @@ class FCFSScheduler:
         gantt_chart = []
         
         for process in processes:
+            # Run the completion-time recurrence on local ints and only store the results
+            arrival = process.arrival_time
             # If the CPU is idle, fast-forward time to the process's arrival
-            if current_time < process.arrival_time:
-                gantt_chart.append(f"({current_time}-{process.arrival_time}: IDLE)")
-                current_time = process.arrival_time
+            if current_time < arrival:
+                gantt_chart.append((current_time, arrival, None))
+                current_time = arrival
+            completion = current_time + process.burst_time
             
             process.start_time = current_time
-            process.completion_time = current_time + process.burst_time
-            process.turnaround_time = process.completion_time - process.arrival_time
-            process.waiting_time = process.turnaround_time - process.burst_time
+            process.completion_time = completion
+            process.turnaround_time = completion - arrival
+            # Non-preemptive, so the whole wait happens before the process starts
+            process.waiting_time = current_time - arrival
             
-            gantt_chart.append(f"({current_time}-{process.completion_time}: P{process.pid})")
-            current_time = process.completion_time
+            gantt_chart.append((current_time, completion, process.pid))
+            current_time = completion
             
         return processes, gantt_chart
 
@@ -50,36 +59,40 @@ class SJFScheduler:
         completed_processes = []
         gantt_chart = []
         
-        # Use a list of remaining processes, sorted by arrival to break ties
-        remaining_processes = sorted(processes, key=lambda p: p.arrival_time)
+        # Walk the processes in arrival order (the sort is stable, so ties keep input order)
+        arrival_sorted = sorted(processes, key=lambda p: p.arrival_time)
+        arrival_idx = 0
+        # Arrived processes, as a min-heap on burst time (ties by arrival, then input order)
+        ready_heap = []
         
-        while remaining_processes:
-            # Get all processes that have arrived and are ready to run
-            ready_queue = [p for p in remaining_processes if p.arrival_time <= current_time]
+        while arrival_idx < len(arrival_sorted) or ready_heap:
+            # Push every process that has arrived onto the ready heap
+            while arrival_idx < len(arrival_sorted) and arrival_sorted[arrival_idx].arrival_time <= current_time:
+                p = arrival_sorted[arrival_idx]
+                heapq.heappush(ready_heap, (p.burst_time, p.arrival_time, arrival_idx, p))
+                arrival_idx += 1
             
-            if not ready_queue:
-                # If no process is ready, CPU is idle. Find the next arrival time.
-                next_arrival_time = min(p.arrival_time for p in remaining_processes)
-                gantt_chart.append(f"({current_time}-{next_arrival_time}: IDLE)")
+            if not ready_heap:
+                # If no process is ready, CPU is idle. Jump to the next arrival time.
+                next_arrival_time = arrival_sorted[arrival_idx].arrival_time
+                gantt_chart.append((current_time, next_arrival_time, None))
                 current_time = next_arrival_time
                 continue
 
-            # Sort the ready queue by burst time to find the shortest job
-            ready_queue.sort(key=lambda p: p.burst_time)
-            
             # Select the shortest job to execute
-            process_to_run = ready_queue[0]
+            # The heap key already carries the burst and arrival times, so reuse them
+            burst, arrival, _, process_to_run = heapq.heappop(ready_heap)
+            completion = current_time + burst
             
             process_to_run.start_time = current_time
-            process_to_run.completion_time = current_time + process_to_run.burst_time
-            process_to_run.turnaround_time = process_to_run.completion_time - process_to_run.arrival_time
-            process_to_run.waiting_time = process_to_run.turnaround_time - process_to_run.burst_time
+            process_to_run.completion_time = completion
+            process_to_run.turnaround_time = completion - arrival
+            process_to_run.waiting_time = current_time - arrival
             
-            gantt_chart.append(f"({current_time}-{process_to_run.completion_time}: P{process_to_run.pid})")
-            current_time = process_to_run.completion_time
+            gantt_chart.append((current_time, completion, process_to_run.pid))
+            current_time = completion
             
             completed_processes.append(process_to_run)
-            remaining_processes.remove(process_to_run)
             
         return completed_processes, gantt_chart
 
@@ -98,21 +111,24 @@ class RoundRobinScheduler:
         # Sort processes by arrival time initially
         processes.sort(key=lambda p: p.arrival_time)
         process_idx = 0
+        # Plain list of arrival times so admission checks are a single int compare
+        n = len(processes)
+        arrivals = [p.arrival_time for p in processes]
         
         # List to store final completed processes
         completed_processes = []
 
-        while process_idx < len(processes) or ready_queue:
+        while process_idx < n or ready_queue:
             # Add newly arrived processes to the ready queue
-            while process_idx < len(processes) and processes[process_idx].arrival_time <= current_time:
+            while process_idx < n and arrivals[process_idx] <= current_time:
                 ready_queue.append(processes[process_idx])
                 process_idx += 1
 
             if not ready_queue:
                 # If queue is empty, CPU is idle. Fast-forward to next process arrival.
-                if process_idx < len(processes):
-                    next_arrival_time = processes[process_idx].arrival_time
-                    gantt_chart.append(f"({current_time}-{next_arrival_time}: IDLE)")
+                if process_idx < n:
+                    next_arrival_time = arrivals[process_idx]
+                    gantt_chart.append((current_time, next_arrival_time, None))
                     current_time = next_arrival_time
                 continue
 
@@ -129,10 +145,14 @@ class RoundRobinScheduler:
             start_slice_time = current_time
             current_time += execution_time
             process.remaining_burst_time -= execution_time
-            gantt_chart.append(f"({start_slice_time}-{current_time}: P{process.pid})")
+            if gantt_chart and gantt_chart[-1][2] == process.pid and gantt_chart[-1][1] == start_slice_time:
+                # Same process ran again right away (nothing else was ready): extend its slice
+                gantt_chart[-1] = (gantt_chart[-1][0], current_time, process.pid)
+            else:
+                gantt_chart.append((start_slice_time, current_time, process.pid))
             
             # Add any processes that arrived during this time slice
-            while process_idx < len(processes) and processes[process_idx].arrival_time <= current_time:
+            while process_idx < n and arrivals[process_idx] <= current_time:
                 ready_queue.append(processes[process_idx])
                 process_idx += 1
 
@@ -141,9 +161,10 @@ class RoundRobinScheduler:
                 ready_queue.append(process)
             else:
                 # If process is finished, calculate its metrics
+                turnaround = current_time - process.arrival_time
                 process.completion_time = current_time
-                process.turnaround_time = process.completion_time - process.arrival_time
-                process.waiting_time = process.turnaround_time - process.burst_time
+                process.turnaround_time = turnaround
+                process.waiting_time = turnaround - process.burst_time
                 completed_processes.append(process)
         
         # Sort by PID for consistent output
@@ -155,24 +176,25 @@ class RoundRobinScheduler:
 
 def print_results(scheduler_name, completed_processes, gantt_chart):
     """Prints a formatted report of the simulation results."""
-    print(f"--- {scheduler_name} ---")
-    print("Gantt Chart: " + " ".join(gantt_chart))
-    
-    total_turnaround_time = 0
-    total_waiting_time = 0
+    # Collect the whole report and emit it with a single write
+    lines = [f"--- {scheduler_name} ---\n"]
+    # Gantt entries are (start, end, pid) tuples, with pid None for idle gaps
+    lines.append("Gantt Chart: " + " ".join(
+        f"({start}-{end}: {'IDLE' if pid is None else f'P{pid}'})" for start, end, pid in gantt_chart) + "\n")
     
-    print("PID | Arrival | Burst | Completion | Turnaround | Waiting")
-    print("----|---------|-------|------------|------------|---------")
-    for p in completed_processes:
-        print(f"{p.pid:<3} | {p.arrival_time:<7} | {p.burst_time:<5} | {p.completion_time:<10} | {p.turnaround_time:<10} | {p.waiting_time:<7}")
-        total_turnaround_time += p.turnaround_time
-        total_waiting_time += p.waiting_time
+    lines.append("PID | Arrival | Burst | Completion | Turnaround | Waiting\n")
+    lines.append("----|---------|-------|------------|------------|---------\n")
+    lines.extend(
+        f"{p.pid:<3} | {p.arrival_time:<7} | {p.burst_time:<5} | {p.completion_time:<10} | {p.turnaround_time:<10} | {p.waiting_time:<7}\n"
+        for p in completed_processes)
         
-    avg_turnaround_time = total_turnaround_time / len(completed_processes)
-    avg_waiting_time = total_waiting_time / len(completed_processes)
+    # Reduce with the built-in sum, kept separate from the formatting above
+    avg_turnaround_time = sum(p.turnaround_time for p in completed_processes) / len(completed_processes)
+    avg_waiting_time = sum(p.waiting_time for p in completed_processes) / len(completed_processes)
     
-    print(f"\nAverage Turnaround Time: {avg_turnaround_time:.2f}")
-    print(f"Average Waiting Time: {avg_waiting_time:.2f}\n")
+    lines.append(f"\nAverage Turnaround Time: {avg_turnaround_time:.2f}\n")
+    lines.append(f"Average Waiting Time: {avg_waiting_time:.2f}\n\n")
+    sys.stdout.write("".join(lines))
 
 
 if __name__ == "__main__":